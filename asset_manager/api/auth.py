@@ -1,17 +1,42 @@
 import os
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Set
 
+import httplib2
+from oauth2client.file import Storage
 from pydrive.auth import GoogleAuth
 from pydrive.drive import GoogleDrive
 
-from .config import credentials_path, client_secrets_path
+from .config import DRIVE_CLIENT_POOL_SIZE, credentials_path, client_secrets_path
 
+# Seconds between checks for a free slot while waiting for a client.
+CLIENT_WAIT_TIMEOUT = 1
 
-def connect_to_google_drive() -> GoogleDrive:
+_storages: Dict[str, Storage] = {}
+_storages_lock = threading.Lock()
+
+
+def shared_storage() -> Storage:
+    """The `Storage` of the saved credentials, shared by every client.
+
+    Its lock is what makes concurrent refreshes of an expired token happen
+    once, so every client has to go through the same instance.
+    """
+    path = credentials_path()
+    with _storages_lock:
+        if path not in _storages:
+            _storages[path] = Storage(path)
+        return _storages[path]
+
+
+def _authenticate() -> GoogleAuth:
     gauth = GoogleAuth()
     gauth.LoadClientConfigFile(client_secrets_path())
     # Try to load saved client credentials
-    credentials_file = credentials_path()
-    gauth.LoadCredentialsFile(credentials_file)
+    storage = shared_storage()
+    gauth.credentials = storage.get()
     if gauth.credentials is None:
         # Authenticate if they're not there
         gauth.LocalWebserverAuth()
@@ -22,6 +47,128 @@ def connect_to_google_drive() -> GoogleDrive:
         # Initialize the saved creds
         gauth.Authorize()
     # Save the current credentials to a file
-    gauth.SaveCredentialsFile(credentials_file)
+    storage.put(gauth.credentials)
+    gauth.credentials.set_store(storage)
+
+    return gauth
+
+
+def connect_to_google_drive() -> GoogleDrive:
+    return GoogleDrive(_authenticate())
+
+
+class DriveClientPool:
+    """Hands out one authorized `GoogleDrive` per worker thread.
+
+    A `GoogleDrive` wraps a single httplib2 connection which isn't thread-safe,
+    so each client gets its own. Clients are created lazily up to `size` and
+    kept around so their connections are reused.
+
+    Every client loads its credentials through `shared_storage()`, whose lock
+    makes sure an expired token is refreshed once and picked up by the others.
+
+    Usage:
+        pool = DriveClientPool()
+        with pool.client() as google_drive:
+            list_children(google_drive, folder_id)
+    """
+
+    def __init__(self, size: Optional[int] = None, fake: bool = False) -> None:
+        self.size = DRIVE_CLIENT_POOL_SIZE if size is None else size
+        if self.size < 1:
+            raise ValueError(f"Pool size must be at least 1, got {self.size}")
+        self.fake = fake
+
+        self._clients: List[GoogleDrive] = []
+        self._in_use: Set[int] = set()
+        self._reserved = 0
+        self._idle_clients: "queue.LifoQueue[GoogleDrive]" = queue.LifoQueue()
+        self._lock = threading.Lock()
+
+        if fake:
+            # Only needed by tests, kept out of regular imports.
+            from .fake_drive import FakeDriveStore
+
+            self.fake_store = FakeDriveStore()
+            self._create_client: Callable[[], GoogleDrive] = self._create_fake_client
+        else:
+            self._authenticated = False
+            self._authenticate_lock = threading.Lock()
+            self._create_client = self._create_drive_client
+
+    def _create_drive_client(self) -> GoogleDrive:
+        with self._authenticate_lock:
+            if not self._authenticated:
+                # Go through the regular flow once so the saved credentials
+                # are valid before every client starts sharing them.
+                _authenticate()
+                self._authenticated = True
+
+        credentials = shared_storage().get()
+        if credentials.access_token_expired:
+            # Refreshing goes through the Storage lock, a token already
+            # refreshed by another client is picked up instead.
+            credentials.refresh(httplib2.Http())
+
+        gauth = GoogleAuth()
+        gauth.credentials = credentials
+        gauth.Authorize()
+        return GoogleDrive(gauth)
+
+    def _create_fake_client(self) -> GoogleDrive:
+        from .fake_drive import FakeGoogleDrive
+
+        return FakeGoogleDrive(self.fake_store)
+
+    def acquire(self) -> GoogleDrive:
+        """Take an idle client, creating one if the pool isn't full yet.
+
+        Blocks until a client is released when all of them are in use.
+        """
+        try:
+            client = self._idle_clients.get_nowait()
+        except queue.Empty:
+            client = self._create_or_wait()
+
+        with self._lock:
+            self._in_use.add(id(client))
+        return client
+
+    def _create_or_wait(self) -> GoogleDrive:
+        while True:
+            with self._lock:
+                if self._reserved < self.size:
+                    self._reserved += 1
+                    break
+            try:
+                return self._idle_clients.get(timeout=CLIENT_WAIT_TIMEOUT)
+            except queue.Empty:
+                # Check again in case a client failed to be created, which
+                # frees its slot.
+                continue
+
+        # Created outside of the lock since it can hit the network.
+        try:
+            client = self._create_client()
+        except Exception:
+            with self._lock:
+                self._reserved -= 1
+            raise
+        with self._lock:
+            self._clients.append(client)
+        return client
+
+    def release(self, client: GoogleDrive) -> None:
+        with self._lock:
+            if id(client) not in self._in_use:
+                raise ValueError(f"{client} wasn't acquired from this pool")
+            self._in_use.remove(id(client))
+        self._idle_clients.put(client)
 
-    return GoogleDrive(gauth)
+    @contextmanager
+    def client(self) -> Iterator[GoogleDrive]:
+        client = self.acquire()
+        try:
+            yield client
+        finally:
+            self.release(client)
@@ -8,3 +8,12 @@ ITEM_STATE_COLORS = {
     "deleted-locally": "#cc402b",
 }
 
+# Number of Google Drive clients used for concurrent listing and transfers.
+DRIVE_CLIENT_POOL_SIZE = 4
+
+# Maximum number of matches returned by a search, more results are truncated.
+SEARCH_RESULT_LIMIT = 1000
+
+# Seconds after which every cached item status is considered stale, to pick
+# up changes made outside of the app.
+STATUS_REFRESH_INTERVAL = 300
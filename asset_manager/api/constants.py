@@ -0,0 +1,2 @@
+GOOGLE_DRIVE_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+FOLDER_MIMETYPE = "application/vnd.google-apps.folder"
@@ -0,0 +1,106 @@
+import hashlib
+import re
+import threading
+import uuid
+from datetime import datetime
+from typing import Dict, List
+
+from .constants import GOOGLE_DRIVE_DATETIME_FORMAT
+
+
+class FakeDriveStore:
+    """In-memory files shared by every `FakeGoogleDrive` of a pool."""
+
+    def __init__(self) -> None:
+        self.files: Dict[str, dict] = {}
+        self.contents: Dict[str, bytes] = {}
+        self.lock = threading.Lock()
+
+    def __deepcopy__(self, memo: dict) -> "FakeDriveStore":
+        # Shared rather than copied, like the drive it stands for, since
+        # `ItemModel` deep copies the items referencing it.
+        return self
+
+
+class FakeGoogleDriveFile(dict):
+    """Covers the parts of `pydrive.files.GoogleDriveFile` used by `Item`."""
+
+    def __init__(self, store: FakeDriveStore, metadata: dict = None) -> None:
+        super().__init__(metadata or {})
+        self.store = store
+
+    def FetchMetadata(self) -> None:
+        with self.store.lock:
+            self.update(self.store.files[self["id"]])
+
+    def Upload(self) -> None:
+        with self.store.lock:
+            self.setdefault("id", uuid.uuid4().hex)
+            self.setdefault("mimeType", "application/octet-stream")
+            self["modifiedDate"] = datetime.utcnow().strftime(
+                GOOGLE_DRIVE_DATETIME_FORMAT
+            )
+            self["alternateLink"] = f"https://drive.google.com/open?id={self['id']}"
+            content = self.store.contents.get(self["id"])
+            if content is not None:
+                self["md5Checksum"] = hashlib.md5(content).hexdigest()
+            self.store.files[self["id"]] = dict(self)
+
+    def SetContentFile(self, filename: str) -> None:
+        with open(filename, "rb") as handle:
+            content = handle.read()
+        self.setdefault("id", uuid.uuid4().hex)
+        with self.store.lock:
+            self.store.contents[self["id"]] = content
+
+    def GetContentFile(self, filename: str, mimetype: str = None) -> None:
+        with open(filename, "wb") as handle:
+            handle.write(self._content())
+
+    def GetContentString(self) -> str:
+        return self._content().decode()
+
+    def _content(self) -> bytes:
+        with self.store.lock:
+            return self.store.contents.get(self["id"], b"")
+
+
+class FakeFileList:
+    def __init__(self, files: List[FakeGoogleDriveFile]) -> None:
+        self.files = files
+
+    def GetList(self) -> List[FakeGoogleDriveFile]:
+        return self.files
+
+
+class FakeGoogleDrive:
+    """Stand-in for `pydrive.drive.GoogleDrive` that never touches the network.
+
+    Only understands the `'<id>' in parents` queries built by `list_children`.
+    """
+
+    def __init__(self, store: FakeDriveStore = None) -> None:
+        self.store = store or FakeDriveStore()
+
+    def __deepcopy__(self, memo: dict) -> "FakeGoogleDrive":
+        return self
+
+    def CreateFile(self, metadata: dict = None) -> FakeGoogleDriveFile:
+        return FakeGoogleDriveFile(self.store, metadata)
+
+    def ListFile(self, param: dict = None) -> FakeFileList:
+        query = (param or {}).get("q", "")
+        match = re.search(r"'([^']+)' in parents", query)
+        with self.store.lock:
+            files = [
+                FakeGoogleDriveFile(self.store, metadata)
+                for metadata in self.store.files.values()
+                if not match
+                or any(
+                    parent["id"] == match.group(1)
+                    for parent in metadata.get("parents", [])
+                )
+            ]
+        if (param or {}).get("orderBy") == "title":
+            files.sort(key=lambda google_file: google_file.get("title", ""))
+        return FakeFileList(files)
@@ -5,7 +5,7 @@ import pdb
 from copy import deepcopy
 from datetime import datetime
 from enum import Enum
-from typing import List
+from typing import List, Optional, Tuple
 
 
 from PySide2.QtCore import QAbstractItemModel, QModelIndex, QObject, Qt
@@ -15,15 +15,14 @@ from pydrive.drive import GoogleDrive
 from pydrive.files import GoogleDriveFile, FileNotDownloadableError
 
 from .config import ITEM_STATE_COLORS, user_settings
+from .constants import FOLDER_MIMETYPE, GOOGLE_DRIVE_DATETIME_FORMAT
 from .files import list_children
+from .search import ItemIndex
 
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
-GOOGLE_DRIVE_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
-
-
 class Item:
     class Status(Enum):
         RemoteOnly = "remote-only"
@@ -81,14 +80,14 @@ class Item:
         if self.is_local:
             return os.path.isdir(self.disk_path)
         else:
-            self.google_file["mimeType"] == "application/vnd.google-apps.folder"
+            self.google_file["mimeType"] == FOLDER_MIMETYPE
     
     @property
     def is_file(self):
         if self.is_remote:
             return os.path.isfile(self.disk_path)
         else:
-            self.google_file["mimeType"] != "application/vnd.google-apps.folder"
+            self.google_file["mimeType"] != FOLDER_MIMETYPE
 
     @property
     def status(self):
@@ -208,7 +207,7 @@ class Item:
         logger.warning(f"Uploading {self.name}")
         if self.is_remote:
             if self.is_file:
-            self.google_file.SetContentFile(self.disk_path)
+                self.google_file.SetContentFile(self.disk_path)
         else:
             if not self.parent_item.is_remote:
                 self.parent_item.upload()
@@ -220,7 +219,7 @@ class Item:
             }
 
             if self.is_folder:
-                metadata["mimeType"] = "application/vnd.google-apps.folder"
+                metadata["mimeType"] = FOLDER_MIMETYPE
 
             self.google_file = self.google_drive.CreateFile(metadata)
 
@@ -257,6 +256,9 @@ class ItemModel(QAbstractItemModel):
 
         self.merge_local_and_remote_trees()
 
+        self.item_index = ItemIndex()
+        self.item_index.add_all(self.root_items)
+
     def create_remote_item_tree(self):
         for root_row, root_id in enumerate(self.root_ids):
             root_file = self.google_drive.CreateFile({"id": root_id})
@@ -374,6 +376,21 @@ class ItemModel(QAbstractItemModel):
                 return item.name
         if role == Qt.ForegroundRole:
             if index.column() == 0:
-                status = item.status.value
-                color = QColor(ITEM_STATE_COLORS[status])
-                return QBrush(color)
+                # `item.status` hits the disk, only the cached one is shown
+                # until the status worker fills it in.
+                status = self.item_index.status(item)
+                if status is None:
+                    return
+                color = ITEM_STATE_COLORS.get(status.value)
+                if color is None:
+                    return
+                return QBrush(QColor(color))
+
+    def set_statuses(self, statuses: List[Tuple[Item, Optional[Item.Status]]]):
+        """Cache statuses computed off the GUI thread and repaint their items."""
+        for item, status in statuses:
+            if item not in self.item_index:
+                continue
+            self.item_index.set_status(item, status)
+            index = self.createIndex(item.row, 0, item)
+            self.dataChanged.emit(index, index, [Qt.ForegroundRole])
@@ -0,0 +1,456 @@
+import re
+from array import array
+from collections import defaultdict
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .config import SEARCH_RESULT_LIMIT
+
+if TYPE_CHECKING:
+    from .item import Item
+
+
+NO_PARENT = -1
+
+# Bytes of the corpus left blank by renames and removals before it is
+# rebuilt, as a fraction of its size.
+COMPACT_RATIO = 0.5
+
+# Bytes of the corpus counted, spread over a few chunks, to estimate how many
+# names contain a segment.
+SAMPLE_SIZE = 1 << 20
+SAMPLE_CHUNKS = 8
+
+# Sets of candidate slots bigger than this are iterated lazily rather than
+# collected, so that broad queries stop as soon as `limit` items matched.
+COLLECT_LIMIT = 50000
+
+# Another set of candidate slots is only collected and intersected while it is
+# at most this many times bigger than the candidates left, past that checking
+# the candidates one by one is cheaper.
+INTERSECT_RATIO = 4
+
+# Scanning the corpus for another name segment costs about as much as checking
+# this many candidates one by one.
+SCAN_CANDIDATES = 5000
+
+
+class SearchResult:
+    def __init__(
+        self,
+        items: List["Item"],
+        matched_slots: Set[int],
+        visible_slots: Set[int],
+        truncated: bool,
+    ) -> None:
+        self.items = items
+        self.matched_slots = matched_slots
+        # Matched slots and all their ancestors.
+        self.visible_slots = visible_slots
+        self.truncated = truncated
+
+
+class ItemIndex:
+    """Search index over item names and statuses.
+
+    Every item gets a slot when added, and a "<name>\\t<slot>\\n" line is
+    appended to a corpus of lowercase names. Finding the slots whose name
+    contains a segment is then a single `re.findall` over the corpus, and
+    how many there are is estimated by counting over a sample of it.
+    Renaming or removing an item blanks its line in place, and the corpus is
+    only rebuilt once blanks take up more than `COMPACT_RATIO` of it.
+
+    Parent slots, children slots and descendant counts are kept alongside, so
+    the tree is walked without touching the items, and a search can tell up
+    front whether a name segment, a parent segment or a status is the
+    cheapest place to start from.
+
+    A query token such as "props/chair" matches items whose name contains
+    "chair" and whose ancestors contain "props", in that order. Slashes
+    around a token are ignored, "props/" matches like "props" and so also
+    matches a file named "props.ma".
+
+    Statuses aren't read when adding items since `Item.status` hits the disk.
+    They start out stale and are filled in through `set_status`, usually by a
+    background worker going over `stale_items()`. The status of an item is
+    considered valid until `invalidate` is called on it, which also marks its
+    subtree and its ancestors stale, or until `invalidate_all` is called for
+    changes made outside of the app.
+    """
+
+    def __init__(self) -> None:
+        self._items: List[Optional["Item"]] = []
+        self._names: List[str] = []
+        self._parents = array("q")
+        self._children: Dict[int, List[int]] = defaultdict(list)
+        self._descendant_counts = array("q")
+        self._statuses: List[Optional["Item.Status"]] = []
+        self._slots: Dict[int, int] = {}
+        self._status_index: Dict["Item.Status", Set[int]] = defaultdict(set)
+        self._stale: Set[int] = set()
+
+        self._corpus = bytearray()
+        self._line_starts = array("q")
+        self._line_ends = array("q")
+        self._blank_size = 0
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, item: "Item") -> bool:
+        return id(item) in self._slots
+
+    def slot(self, item: "Item") -> Optional[int]:
+        return self._slots.get(id(item))
+
+    def parent_slot(self, slot: int) -> int:
+        return self._parents[slot]
+
+    def add(self, item: "Item", recursive: bool = True) -> None:
+        stack = [item]
+        while stack:
+            item = stack.pop()
+            self._add_one(item)
+            if recursive:
+                stack.extend(item.children)
+
+    def add_all(self, items: Iterable["Item"]) -> None:
+        for item in items:
+            self.add(item)
+
+    def _add_one(self, item: "Item") -> None:
+        slot = self.slot(item)
+        if slot is not None:
+            self._rename(slot, item)
+            self._stale.add(slot)
+            return
+
+        slot = len(self._items)
+        parent_slot = None
+        if item.parent_item is not None:
+            parent_slot = self.slot(item.parent_item)
+        if parent_slot is None:
+            parent_slot = NO_PARENT
+        else:
+            self._children[parent_slot].append(slot)
+
+        self._slots[id(item)] = slot
+        self._items.append(item)
+        self._names.append(self._normalize(item.name))
+        self._parents.append(parent_slot)
+        self._descendant_counts.append(0)
+        self._statuses.append(None)
+        self._line_starts.append(0)
+        self._line_ends.append(0)
+        self._stale.add(slot)
+        self._append_line(slot)
+        self._count_descendant(slot, 1)
+
+    def remove(self, item: "Item", recursive: bool = True) -> None:
+        stack = [item]
+        while stack:
+            item = stack.pop()
+            slot = self._slots.pop(id(item), None)
+            if slot is not None:
+                self._discard_status(slot)
+                self._stale.discard(slot)
+                self._count_descendant(slot, -1)
+                self._blank_line(slot)
+                self._items[slot] = None
+                self._names[slot] = ""
+            if recursive:
+                stack.extend(item.children)
+        self._compact_if_needed()
+
+    def update(self, item: "Item") -> None:
+        """Re-read the name of the item and invalidate its status."""
+        slot = self.slot(item)
+        if slot is None:
+            self.add(item)
+            return
+        self._rename(slot, item)
+        self.invalidate(item)
+
+    def _rename(self, slot: int, item: "Item") -> None:
+        name = self._normalize(item.name)
+        if name != self._names[slot]:
+            self._names[slot] = name
+            self._blank_line(slot)
+            self._append_line(slot)
+            self._compact_if_needed()
+
+    def _count_descendant(self, slot: int, delta: int) -> None:
+        parent = self._parents[slot]
+        while parent != NO_PARENT:
+            self._descendant_counts[parent] += delta
+            parent = self._parents[parent]
+
+    def _append_line(self, slot: int) -> None:
+        self._line_starts[slot] = len(self._corpus)
+        self._corpus += f"{self._names[slot]}\t{slot}\n".encode()
+        self._line_ends[slot] = len(self._corpus) - 1
+
+    def _blank_line(self, slot: int) -> None:
+        # Every match needs a tab before the newline ending its line, so a
+        # line of newlines never matches.
+        start = self._line_starts[slot]
+        end = self._line_ends[slot]
+        self._corpus[start:end] = b"\n" * (end - start)
+        self._blank_size += end - start
+        self._line_starts[slot] = self._line_ends[slot] = 0
+
+    def _compact_if_needed(self) -> None:
+        if self._blank_size <= len(self._corpus) * COMPACT_RATIO:
+            return
+        self._corpus = bytearray()
+        self._blank_size = 0
+        for slot in range(len(self._items)):
+            if self._items[slot] is not None:
+                self._append_line(slot)
+
+    def invalidate(self, item: "Item") -> None:
+        """Mark the status of the item, its subtree and its ancestors stale."""
+        slot = self.slot(item)
+        if slot is None:
+            return
+        self._stale.add(slot)
+        self._stale.update(self._descendants([slot]))
+
+        slot = self._parents[slot]
+        while slot != NO_PARENT:
+            self._stale.add(slot)
+            slot = self._parents[slot]
+
+    def invalidate_all(self) -> None:
+        self._stale.update(self._slots.values())
+
+    def stale_items(self) -> List["Item"]:
+        return [
+            self._items[slot]
+            for slot in sorted(self._stale)
+            if self._items[slot] is not None
+        ]
+
+    def set_status(self, item: "Item", status: Optional["Item.Status"]) -> None:
+        slot = self.slot(item)
+        if slot is None:
+            return
+        self._discard_status(slot)
+        self._statuses[slot] = status
+        if status is not None:
+            self._status_index[status].add(slot)
+        self._stale.discard(slot)
+
+    def status(self, item: "Item") -> Optional["Item.Status"]:
+        slot = self.slot(item)
+        if slot is None:
+            return None
+        return self._statuses[slot]
+
+    def _discard_status(self, slot: int) -> None:
+        status = self._statuses[slot]
+        if status is not None:
+            self._status_index[status].discard(slot)
+            self._statuses[slot] = None
+
+    def search(
+        self,
+        text: str = "",
+        status: Optional["Item.Status"] = None,
+        limit: int = SEARCH_RESULT_LIMIT,
+    ) -> SearchResult:
+        """Return up to `limit` items matching every token of `text` and `status`.
+
+        Items whose status isn't known yet never match a status filter.
+        """
+        tokens = []
+        for token in self._normalize(text).split():
+            segments = [segment for segment in token.split("/") if segment]
+            if segments:
+                tokens.append((segments[-1], segments[:-1]))
+
+        matched_slots = []
+        truncated = False
+        candidates, checks = self._candidates(tokens, status)
+        for slot in candidates:
+            if self._matches(slot, checks, status):
+                if len(matched_slots) == limit:
+                    truncated = True
+                    break
+                matched_slots.append(slot)
+
+        visible_slots = set()
+        for slot in matched_slots:
+            while slot != NO_PARENT and slot not in visible_slots:
+                visible_slots.add(slot)
+                slot = self._parents[slot]
+
+        return SearchResult(
+            [self._items[slot] for slot in matched_slots],
+            set(matched_slots),
+            visible_slots,
+            truncated,
+        )
+
+    def _candidates(self, tokens, status) -> Tuple[Iterable[int], list]:
+        """Narrow down the slots that may match before checking them one by one.
+
+        Every status, name segment and parent segment of the query is a set of
+        slots all matches belong to. Starting from the smallest, the sets are
+        collected and intersected while they stay cheap to collect.
+
+        Return the candidates along with the tokens `_matches` still has to
+        check them against, parent segments being dropped from the tokens
+        whose folders the candidates were taken from.
+        """
+        sources = []
+        if status is not None:
+            status_slots = self._status_index.get(status, set())
+            sources.append((len(status_slots), "status", status_slots))
+
+        for segment in {name_segment for name_segment, _ in tokens}:
+            sources.append((self._estimate(segment), "name", segment))
+
+        smallest = min(sources)[0] if sources else len(self._slots)
+        for position, (_, parent_segments) in enumerate(tokens):
+            if not parent_segments:
+                continue
+            segment = parent_segments[-1]
+            if self._estimate(segment) >= smallest:
+                # Too common to narrow anything down, left to `_matches`.
+                continue
+            # Folders nested under the outer segments of the path, in order.
+            path = [(segment, parent_segments[:-1])]
+            folders = self._outermost(
+                {
+                    slot
+                    for slot in self._slots_containing(segment)
+                    if self._descendant_counts[slot]
+                    and self._matches(slot, path, None)
+                }
+            )
+            if not folders:
+                return (), tokens
+            cost = sum(self._descendant_counts[folder] for folder in folders)
+            sources.append((cost, "parent", (position, folders)))
+
+        if not sources:
+            return range(len(self._items)), tokens
+        sources.sort(key=lambda source: source[0])
+
+        candidates = None
+        covered = set()
+        for cost, kind, value in sources:
+            if candidates is None:
+                if kind != "status" and cost > COLLECT_LIMIT:
+                    break
+            elif kind == "status":
+                # Costs no more than the candidates left, always worth it.
+                pass
+            elif cost > len(candidates) * INTERSECT_RATIO:
+                continue
+            elif kind == "name" and len(candidates) < SCAN_CANDIDATES:
+                continue
+
+            if kind == "status":
+                slots = value
+            elif kind == "name":
+                slots = self._slots_containing(value)
+            else:
+                position, folders = value
+                covered.add(position)
+                slots = self._descendants(folders)
+            if candidates is None:
+                candidates = set(slots)
+            else:
+                candidates.intersection_update(slots)
+            if not candidates:
+                return (), tokens
+
+        if candidates is None:
+            _, kind, value = sources[0]
+            if kind == "name":
+                candidates = self._find(value)
+            else:
+                position, folders = value
+                covered.add(position)
+                candidates = self._descendants(folders)
+        checks = [
+            (name_segment, [] if position in covered else parent_segments)
+            for position, (name_segment, parent_segments) in enumerate(tokens)
+        ]
+        return candidates, checks
+
+    def _pattern(self, segment: str) -> "re.Pattern":
+        # Greedy up to the last tab of the line, where the slot is.
+        return re.compile(re.escape(segment.encode()) + rb"[^\n]*\t(\d+)")
+
+    def _find(self, segment: str) -> Iterator[int]:
+        """Iterate the slots whose name contains `segment`."""
+        for match in self._pattern(segment).finditer(self._corpus):
+            yield int(match.group(1))
+
+    def _slots_containing(self, segment: str) -> Set[int]:
+        return set(map(int, self._pattern(segment).findall(self._corpus)))
+
+    def _estimate(self, segment: str) -> int:
+        """Roughly how many names contain `segment`."""
+        needle = segment.encode()
+        size = len(self._corpus)
+        if size <= SAMPLE_SIZE:
+            return self._corpus.count(needle)
+
+        chunk_size = SAMPLE_SIZE // SAMPLE_CHUNKS
+        step = size // SAMPLE_CHUNKS
+        count = sum(
+            self._corpus.count(needle, start, start + chunk_size)
+            for start in range(0, step * SAMPLE_CHUNKS, step)
+        )
+        return count * size // SAMPLE_SIZE
+
+    def _outermost(self, slots: Set[int]) -> List[int]:
+        """The slots with descendants that aren't nested under another one."""
+        outermost = []
+        for slot in slots:
+            if not self._descendant_counts[slot]:
+                continue
+            parent = self._parents[slot]
+            while parent != NO_PARENT and parent not in slots:
+                parent = self._parents[parent]
+            if parent == NO_PARENT:
+                outermost.append(slot)
+        return outermost
+
+    def _descendants(self, slots: Iterable[int]) -> Iterator[int]:
+        level = list(slots)
+        while level:
+            next_level = []
+            for slot in level:
+                children = self._children.get(slot)
+                if children:
+                    next_level.extend(children)
+            yield from next_level
+            level = next_level
+
+    def _matches(self, slot: int, tokens, status) -> bool:
+        if self._items[slot] is None:
+            return False
+        if status is not None and self._statuses[slot] != status:
+            return False
+
+        name = self._names[slot]
+        for name_segment, parent_segments in tokens:
+            if name_segment not in name:
+                return False
+            parent = self._parents[slot]
+            for segment in reversed(parent_segments):
+                while parent != NO_PARENT and segment not in self._names[parent]:
+                    parent = self._parents[parent]
+                if parent == NO_PARENT:
+                    return False
+                parent = self._parents[parent]
+        return True
+
+    @staticmethod
+    def _normalize(name: str) -> str:
+        # Tabs and newlines delimit the lines of the corpus.
+        return name.lower().replace("\t", " ").replace("\n", " ")
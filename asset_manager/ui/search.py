@@ -0,0 +1,143 @@
+import logging
+from typing import List, Optional
+
+from PySide2 import QtCore, QtWidgets
+
+from asset_manager.api.item import Item
+from asset_manager.api.search import NO_PARENT, SearchResult
+
+
+logger = logging.getLogger(__name__)
+
+# Milliseconds to wait after the last keystroke before searching.
+SEARCH_DELAY = 150
+
+STATUS_BATCH_SIZE = 500
+
+
+class ItemFilterProxyModel(QtCore.QSortFilterProxyModel):
+    """Filters an `ItemModel` using its `ItemIndex` instead of walking the tree.
+
+    Matching items, their ancestors and their descendants are accepted.
+    """
+
+    def __init__(self, parent: QtCore.QObject = None):
+        super().__init__(parent)
+        self.text = ""
+        self.status: Optional[Item.Status] = None
+        self.result: Optional[SearchResult] = None
+
+    def set_filter(self, text: str = "", status: Optional[Item.Status] = None):
+        self.text = text
+        self.status = status
+        self.refresh()
+
+    def refresh(self):
+        if not self.text.strip() and self.status is None:
+            self.result = None
+        else:
+            self.result = self.sourceModel().item_index.search(self.text, self.status)
+        self.invalidateFilter()
+
+    def filterAcceptsRow(
+        self, source_row: int, source_parent: QtCore.QModelIndex
+    ) -> bool:
+        if self.result is None:
+            return True
+
+        item_index = self.sourceModel().item_index
+        item = self.sourceModel().index(source_row, 0, source_parent).internalPointer()
+        slot = item_index.slot(item)
+        if slot is None:
+            return False
+        if slot in self.result.visible_slots:
+            return True
+
+        slot = item_index.parent_slot(slot)
+        while slot != NO_PARENT:
+            if slot in self.result.matched_slots:
+                return True
+            slot = item_index.parent_slot(slot)
+        return False
+
+
+class StatusWorker(QtCore.QThread):
+    """Computes `Item.status` off the GUI thread, since it hashes local files.
+
+    Results are emitted in batches of `(item, status)` pairs, the status being
+    `None` when it couldn't be computed, along with the generation the worker
+    was started for so batches of an outdated worker can be dropped.
+    """
+
+    statuses_computed = QtCore.Signal(int, list)
+
+    def __init__(
+        self, items: List[Item], generation: int, parent: QtCore.QObject = None
+    ):
+        super().__init__(parent)
+        self.items = items
+        self.generation = generation
+
+    def run(self):
+        batch = []
+        for item in self.items:
+            if self.isInterruptionRequested():
+                return
+            try:
+                status = item.status
+            except Exception:
+                logger.exception(f"Couldn't compute the status of {item.name}")
+                status = None
+            batch.append((item, status))
+            if len(batch) == STATUS_BATCH_SIZE:
+                self.statuses_computed.emit(self.generation, batch)
+                batch = []
+        if batch:
+            self.statuses_computed.emit(self.generation, batch)
+
+
+class SearchBar(QtWidgets.QWidget):
+    filter_changed = QtCore.Signal(str, object)
+
+    def __init__(self, parent: QtWidgets.QWidget = None):
+        super().__init__(parent)
+
+        layout = QtWidgets.QHBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.setLayout(layout)
+
+        self.search_line_edit = QtWidgets.QLineEdit()
+        self.search_line_edit.setPlaceholderText("Search")
+        self.search_line_edit.setClearButtonEnabled(True)
+        layout.addWidget(self.search_line_edit)
+
+        self.status_combo_box = QtWidgets.QComboBox()
+        self.status_combo_box.addItem("All", None)
+        for status in Item.Status:
+            self.status_combo_box.addItem(status.value, status)
+        layout.addWidget(self.status_combo_box)
+
+        self.result_label = QtWidgets.QLabel()
+        layout.addWidget(self.result_label)
+
+        self.search_timer = QtCore.QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DELAY)
+        self.search_timer.timeout.connect(self._emit_filter_changed)
+
+        self.search_line_edit.textChanged.connect(self.search_timer.start)
+        self.status_combo_box.currentIndexChanged.connect(self._emit_filter_changed)
+
+    def show_result(self, result: Optional[SearchResult]):
+        if result is None:
+            self.result_label.clear()
+        elif result.truncated:
+            self.result_label.setText(f"{len(result.items)}+ results")
+        else:
+            self.result_label.setText(f"{len(result.items)} results")
+
+    def _emit_filter_changed(self, *args):
+        self.search_timer.stop()
+        text = self.search_line_edit.text()
+        status = self.status_combo_box.currentData()
+        self.filter_changed.emit(text, status)
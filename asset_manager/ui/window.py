@@ -1,13 +1,18 @@
 import logging
 import subprocess
 import webbrowser
-from typing import List
+from typing import List, Tuple
 
 from PySide2 import QtCore, QtGui, QtWidgets
 
 from asset_manager.api.item import ItemModel, Item
-from asset_manager.api.auth import connect_to_google_drive
-from asset_manager.api.config import FOLDER_IDS, user_settings
+from asset_manager.api.auth import DriveClientPool
+from asset_manager.api.config import (
+    FOLDER_IDS,
+    STATUS_REFRESH_INTERVAL,
+    user_settings,
+)
+from asset_manager.ui.search import ItemFilterProxyModel, SearchBar, StatusWorker
 from asset_manager.ui.settings import SettingsDialog
 
 logger = logging.getLogger(__name__)
@@ -25,15 +30,53 @@ class AssetManagerWindow(QtWidgets.QMainWindow):
         file_menu = menu_bar.addMenu("&File")
         file_menu.addAction(settings_action)
 
+        central_widget = QtWidgets.QWidget()
+        layout = QtWidgets.QVBoxLayout()
+        central_widget.setLayout(layout)
+        self.setCentralWidget(central_widget)
+
+        self.search_bar = SearchBar()
+        layout.addWidget(self.search_bar)
+
         self.tree_view = QtWidgets.QTreeView()
         self.tree_view.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
         self.tree_view.customContextMenuRequested.connect(self.open_menu)
-        self.setCentralWidget(self.tree_view)
-        google_drive = connect_to_google_drive()
-        model = ItemModel(google_drive, FOLDER_IDS)
-        self.tree_view.setModel(model)
+        layout.addWidget(self.tree_view)
+        # The model and its items share a single client for now, taken from
+        # the pool so background work can acquire clients of its own.
+        self.drive_pool = DriveClientPool()
+        google_drive = self.drive_pool.acquire()
+        self.model = ItemModel(google_drive, FOLDER_IDS)
+        self.proxy_model = ItemFilterProxyModel()
+        self.proxy_model.setSourceModel(self.model)
+        self.tree_view.setModel(self.proxy_model)
         self.tree_view.header().hide()
 
+        self.search_bar.filter_changed.connect(self.filter_items)
+
+        # Bumped every time statuses are recomputed, batches emitted by the
+        # workers of an older generation are dropped.
+        self.status_generation = 0
+        self.status_workers: List[StatusWorker] = []
+        self._update_statuses()
+
+        # Statuses also depend on changes made outside of the app.
+        self.status_timer = QtCore.QTimer(self)
+        self.status_timer.setInterval(STATUS_REFRESH_INTERVAL * 1000)
+        self.status_timer.timeout.connect(self._refresh_all_statuses)
+        self.status_timer.start()
+
+    def closeEvent(self, event):
+        for worker in self.status_workers:
+            worker.requestInterruption()
+        for worker in self.status_workers:
+            worker.wait()
+        super().closeEvent(event)
+
+    def filter_items(self, text: str, status: Item.Status = None):
+        self.proxy_model.set_filter(text, status)
+        self.search_bar.show_result(self.proxy_model.result)
+
     def open_settings(self):
         dialog = SettingsDialog()
         dialog.exec_()
@@ -78,11 +121,13 @@ class AssetManagerWindow(QtWidgets.QMainWindow):
             if button != QtWidgets.QMessageBox.Yes:
                 return
         item.download()
+        self._refresh_item(item)
 
     def upload(self):
         logger.warning("Uploading")
         item = self._get_selected_item()
         item.upload()
+        self._refresh_item(item)
     
     def open_in_explorer(self, *args, **kwargs):
         item = self._get_selected_item()
@@ -102,10 +147,53 @@ class AssetManagerWindow(QtWidgets.QMainWindow):
             webbrowser.open_new_tab(item.url)
 
     def _get_selected_items(self) -> List[Item]:
-        return [f.internalPointer() for f in self.tree_view.selectedIndexes()]
+        return [
+            self.proxy_model.mapToSource(f).internalPointer()
+            for f in self.tree_view.selectedIndexes()
+        ]
 
     def _get_selected_item(self) -> Item:
-        return self.tree_view.currentIndex().internalPointer()
+        index = self.proxy_model.mapToSource(self.tree_view.currentIndex())
+        return index.internalPointer()
+
+    def _refresh_item(self, item: Item):
+        # Uploads also create the missing parents, so their ancestors are
+        # invalidated along with their subtree.
+        self.model.item_index.update(item)
+        self.filter_items(self.proxy_model.text, self.proxy_model.status)
+        self._update_statuses()
+
+    def _refresh_all_statuses(self):
+        self.model.item_index.invalidate_all()
+        self._update_statuses()
+
+    def _update_statuses(self):
+        # Outdated workers stop on their own, waiting for them would block
+        # the GUI thread on whichever file they are hashing.
+        for worker in self.status_workers:
+            worker.requestInterruption()
+
+        self.status_generation += 1
+        worker = StatusWorker(
+            self.model.item_index.stale_items(), self.status_generation, self
+        )
+        worker.statuses_computed.connect(self._set_statuses)
+        worker.finished.connect(lambda: self._forget_status_worker(worker))
+        self.status_workers.append(worker)
+        worker.start()
+
+    def _forget_status_worker(self, worker: StatusWorker):
+        self.status_workers.remove(worker)
+        worker.deleteLater()
+
+    def _set_statuses(
+        self, generation: int, statuses: List[Tuple[Item, Item.Status]]
+    ):
+        if generation != self.status_generation:
+            return
+        self.model.set_statuses(statuses)
+        if self.proxy_model.status is not None:
+            self.filter_items(self.proxy_model.text, self.proxy_model.status)
 
     @staticmethod
     def _is_local_folder_modified(folder: Item) -> bool:
@@ -0,0 +1,39 @@
+import pytest
+
+from asset_manager.api.item import Item
+
+
+Status = Item.Status
+
+
+class StubItem:
+    """Just what `ItemIndex` reads from an `Item`, without the disk or Drive."""
+
+    def __init__(self, name, parent=None):
+        self.name = name
+        self.parent_item = parent
+        self.children = []
+        if parent is not None:
+            parent.children.append(self)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-benchmarks",
+        action="store_true",
+        default=False,
+        help="run the timing benchmarks marked with @pytest.mark.benchmark",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "benchmark: timing benchmark, opt-in")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-benchmarks"):
+        return
+    skip_benchmark = pytest.mark.skip(reason="needs --run-benchmarks")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
@@ -0,0 +1,183 @@
+import datetime
+import threading
+import time
+from copy import deepcopy
+
+import pytest
+from oauth2client.client import OAuth2Credentials
+from oauth2client.file import Storage
+
+from asset_manager.api import auth
+from asset_manager.api.auth import DriveClientPool
+from asset_manager.api.fake_drive import FakeGoogleDrive
+from asset_manager.api.files import list_children
+
+
+def test_pool_size_must_be_positive():
+    with pytest.raises(ValueError):
+        DriveClientPool(size=0, fake=True)
+
+
+def test_clients_are_created_lazily():
+    pool = DriveClientPool(size=3, fake=True)
+    assert pool._clients == []
+
+    with pool.client() as google_drive:
+        assert isinstance(google_drive, FakeGoogleDrive)
+    assert len(pool._clients) == 1
+
+
+def test_idle_clients_are_reused():
+    pool = DriveClientPool(size=3, fake=True)
+    with pool.client() as first:
+        pass
+    with pool.client() as second:
+        pass
+    assert first is second
+    assert len(pool._clients) == 1
+
+
+def test_acquire_blocks_when_every_client_is_in_use():
+    pool = DriveClientPool(size=1, fake=True)
+    client = pool.acquire()
+    acquired = []
+    thread = threading.Thread(target=lambda: acquired.append(pool.acquire()))
+    thread.start()
+
+    time.sleep(0.1)
+    assert acquired == []
+
+    pool.release(client)
+    thread.join(timeout=1)
+    assert acquired == [client]
+
+
+def test_release_rejects_foreign_clients():
+    pool = DriveClientPool(size=1, fake=True)
+    other_pool = DriveClientPool(size=1, fake=True)
+    client = pool.acquire()
+
+    with pytest.raises(ValueError):
+        other_pool.release(client)
+
+    pool.release(client)
+    with pytest.raises(ValueError):
+        pool.release(client)
+
+
+def test_clients_are_never_shared_between_threads():
+    size = 3
+    pool = DriveClientPool(size=size, fake=True)
+    in_use = set()
+    lock = threading.Lock()
+    errors = []
+
+    def work():
+        for _ in range(20):
+            with pool.client() as google_drive:
+                with lock:
+                    if id(google_drive) in in_use:
+                        errors.append(google_drive)
+                    in_use.add(id(google_drive))
+                time.sleep(0.001)
+                with lock:
+                    in_use.remove(id(google_drive))
+
+    threads = [threading.Thread(target=work) for _ in range(size * 4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(pool._clients) == size
+
+
+def test_fake_clients_share_files():
+    pool = DriveClientPool(size=2, fake=True)
+    first = pool.acquire()
+    second = pool.acquire()
+    assert first is not second
+
+    folder = first.CreateFile({"id": "folder", "title": "Folder"})
+    folder.Upload()
+    second.CreateFile({"title": "b", "parents": [{"id": "folder"}]}).Upload()
+    first.CreateFile({"title": "a", "parents": [{"id": "folder"}]}).Upload()
+
+    titles = [google_file["title"] for google_file in list_children(second, "folder")]
+    assert titles == ["a", "b"]
+
+
+def test_fake_files_can_be_deep_copied():
+    pool = DriveClientPool(size=1, fake=True)
+    with pool.client() as google_drive:
+        google_file = google_drive.CreateFile({"id": "file", "title": "File"})
+        google_file.Upload()
+
+    copied = deepcopy({"file": google_file, "drive": google_drive})
+    assert copied["drive"] is google_drive
+    assert copied["file"].store is google_drive.store
+    assert copied["file"]["title"] == "File"
+
+
+class StubGoogleAuth:
+    def __init__(self):
+        self.credentials = None
+
+    def Authorize(self):
+        assert not self.credentials.access_token_expired
+
+
+def test_expired_token_is_refreshed_once_across_clients(monkeypatch, tmp_path):
+    credentials_file = str(tmp_path / "credentials.json")
+    expired = OAuth2Credentials(
+        "expired-token",
+        "client-id",
+        "client-secret",
+        "refresh-token",
+        datetime.datetime.utcnow() - datetime.timedelta(hours=1),
+        "https://oauth2.googleapis.com/token",
+        None,
+    )
+    Storage(credentials_file).put(expired)
+
+    monkeypatch.setattr(auth, "_storages", {})
+    monkeypatch.setattr(auth, "credentials_path", lambda: credentials_file)
+    monkeypatch.setattr(auth, "_authenticate", lambda: None)
+    monkeypatch.setattr(auth, "GoogleAuth", StubGoogleAuth)
+    monkeypatch.setattr(auth, "GoogleDrive", lambda gauth: gauth)
+
+    refreshes = []
+
+    def refresh(credentials, http):
+        refreshes.append(credentials)
+        time.sleep(0.05)
+        credentials.access_token = "fresh-token"
+        credentials.token_expiry = datetime.datetime.utcnow() + datetime.timedelta(
+            hours=1
+        )
+        credentials.store.locked_put(credentials)
+
+    monkeypatch.setattr(OAuth2Credentials, "_do_refresh_request", refresh)
+
+    size = 4
+    pool = DriveClientPool(size=size)
+    barrier = threading.Barrier(size)
+    clients = []
+
+    def create():
+        barrier.wait()
+        clients.append(pool.acquire())
+
+    threads = [threading.Thread(target=create) for _ in range(size)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(refreshes) == 1
+    assert len(clients) == size
+    assert all(
+        client.credentials.access_token == "fresh-token" for client in clients
+    )
+    assert Storage(credentials_file).get().access_token == "fresh-token"
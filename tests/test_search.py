@@ -0,0 +1,154 @@
+import pytest
+
+from asset_manager.api.search import ItemIndex
+
+from conftest import Status, StubItem
+
+
+@pytest.fixture
+def tree():
+    root = StubItem("Assets")
+    props = StubItem("Props", root)
+    chair = StubItem("Chair_v01.ma", props)
+    table = StubItem("Table_v01.ma", props)
+    characters = StubItem("Characters", root)
+    hero = StubItem("Hero_chair_rig.ma", characters)
+    return {
+        "root": root,
+        "props": props,
+        "chair": chair,
+        "table": table,
+        "characters": characters,
+        "hero": hero,
+    }
+
+
+@pytest.fixture
+def index(tree):
+    index = ItemIndex()
+    index.add(tree["root"])
+    return index
+
+
+def names(result):
+    return sorted(item.name for item in result.items)
+
+
+def test_add_indexes_whole_tree(index):
+    assert len(index) == 6
+
+
+def test_search_short_token(index):
+    assert names(index.search("ma")) == [
+        "Chair_v01.ma",
+        "Hero_chair_rig.ma",
+        "Table_v01.ma",
+    ]
+
+
+def test_search_long_token_is_case_insensitive(index):
+    assert names(index.search("CHAIR")) == ["Chair_v01.ma", "Hero_chair_rig.ma"]
+
+
+def test_search_requires_every_token(index):
+    assert names(index.search("chair rig")) == ["Hero_chair_rig.ma"]
+    assert names(index.search("chair missing")) == []
+
+
+def test_search_path_token(index):
+    assert names(index.search("props/chair")) == ["Chair_v01.ma"]
+    assert names(index.search("assets/characters/chair")) == ["Hero_chair_rig.ma"]
+    assert names(index.search("characters/props/chair")) == []
+
+
+def test_search_ignores_slashes_around_token(index, tree):
+    StubItem("props.ma", tree["characters"])
+    index.update(tree["characters"].children[-1])
+
+    assert names(index.search("props/")) == ["Props", "props.ma"]
+    assert names(index.search("/props")) == ["Props", "props.ma"]
+
+
+def test_search_parent_segment_only_matches_descendants(index):
+    assert names(index.search("characters/.ma")) == ["Hero_chair_rig.ma"]
+    assert names(index.search("props/.ma")) == ["Chair_v01.ma", "Table_v01.ma"]
+
+
+def test_search_visible_slots_include_ancestors(index, tree):
+    result = index.search("props/chair")
+    assert result.visible_slots == {
+        index.slot(tree["chair"]),
+        index.slot(tree["props"]),
+        index.slot(tree["root"]),
+    }
+
+
+def test_search_limit(index):
+    result = index.search("ma", limit=2)
+    assert len(result.items) == 2
+    assert result.truncated
+    assert not index.search("ma", limit=3).truncated
+
+
+def test_statuses_start_stale(index, tree):
+    assert len(index.stale_items()) == 6
+    assert index.search(status=Status.Synced).items == []
+
+
+def test_search_status_with_text(index, tree):
+    index.set_status(tree["chair"], Status.Synced)
+    index.set_status(tree["table"], Status.Synced)
+    index.set_status(tree["hero"], Status.LocalOnly)
+
+    assert names(index.search(status=Status.Synced)) == [
+        "Chair_v01.ma",
+        "Table_v01.ma",
+    ]
+    assert names(index.search("chair", Status.Synced)) == ["Chair_v01.ma"]
+    assert names(index.search("chair", Status.RemoteOnly)) == []
+
+
+def test_invalidate_marks_subtree_and_ancestors(index, tree):
+    for item in tree.values():
+        index.set_status(item, Status.Synced)
+
+    index.invalidate(tree["props"])
+
+    stale = {item.name for item in index.stale_items()}
+    assert stale == {"Assets", "Props", "Chair_v01.ma", "Table_v01.ma"}
+    # Cached statuses are kept until the new ones come in.
+    assert index.status(tree["props"]) == Status.Synced
+
+
+def test_remove(index, tree):
+    index.set_status(tree["chair"], Status.Synced)
+    index.remove(tree["props"])
+
+    assert len(index) == 3
+    assert tree["chair"] not in index
+    assert names(index.search("chair")) == ["Hero_chair_rig.ma"]
+    assert index.search(status=Status.Synced).items == []
+
+
+def test_update_renamed_item(index, tree):
+    tree["table"].name = "Desk_v01.ma"
+    index.update(tree["table"])
+
+    assert names(index.search("table")) == []
+    assert names(index.search("desk")) == ["Desk_v01.ma"]
+
+
+def test_update_renamed_item_many_times(index, tree):
+    for version in range(100):
+        tree["table"].name = f"Table_v{version:03}.ma"
+        index.update(tree["table"])
+
+    assert names(index.search("table")) == ["Table_v099.ma"]
+    assert names(index.search("props/v0")) == ["Chair_v01.ma", "Table_v099.ma"]
+
+
+def test_update_new_item(index, tree):
+    lamp = StubItem("Lamp.ma", tree["props"])
+    index.update(lamp)
+
+    assert names(index.search("props/lamp")) == ["Lamp.ma"]
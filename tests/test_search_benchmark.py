@@ -0,0 +1,96 @@
+import random
+import string
+import time
+
+import pytest
+
+from asset_manager.api.search import ItemIndex
+
+from conftest import Status, StubItem
+
+pytestmark = pytest.mark.benchmark
+
+NODE_COUNT = 500000
+TARGET_SECONDS = 0.05
+
+
+@pytest.fixture(scope="module")
+def large_tree():
+    rng = random.Random(0)
+    statuses = list(Status)
+    root = StubItem("root")
+    folders = [root]
+    items = [root]
+    while len(items) < NODE_COUNT:
+        parent = rng.choice(folders)
+        length = rng.randint(6, 20)
+        name = "".join(rng.choices(string.ascii_lowercase + "_", k=length))
+        if rng.random() < 0.1:
+            folders.append(StubItem(name, parent))
+            items.append(folders[-1])
+        else:
+            items.append(StubItem(name + ".ma", parent))
+
+    index = ItemIndex()
+    index.add(root)
+    for item in items:
+        index.set_status(item, rng.choice(statuses))
+    return index, root, folders
+
+
+def search_time(index, text, status=None):
+    start = time.perf_counter()
+    index.search(text, status)
+    return time.perf_counter() - start
+
+
+def assert_fast(index, text, status=None):
+    timings = [search_time(index, text, status) for _ in range(3)]
+    assert min(timings) < TARGET_SECONDS, (text, status, timings)
+
+
+@pytest.mark.parametrize(
+    "text, status",
+    [
+        ("a", None),
+        ("ab", None),
+        ("chair", None),
+        ("abc def", None),
+        ("ma zq", None),
+        ("ma qq", Status.Synced),
+        ("", Status.Synced),
+        ("ma", Status.ModifiedLocally),
+        ("qzx", Status.DeletedRemotely),
+        ("abc/", None),
+        ("props/chair", None),
+        ("zzz/ma", None),
+        ("qzx/ma", None),
+        ("root/.ma", None),
+        ("ab/cd/.ma", None),
+        ("zzz/.ma", Status.Synced),
+    ],
+)
+def test_search_is_fast_on_large_tree(large_tree, text, status):
+    index, _, _ = large_tree
+    assert_fast(index, text, status)
+
+
+def test_search_is_fast_after_updates(large_tree):
+    index, root, folders = large_tree
+    new_folder = StubItem("renamed_folder", folders[-1])
+    new_item = StubItem("fresh_upload.ma", new_folder)
+    renamed_item = root.children[0]
+    while renamed_item.children:
+        renamed_item = renamed_item.children[0]
+    renamed_item.name = "renamed_file.ma"
+
+    start = time.perf_counter()
+    index.update(new_folder)
+    index.update(renamed_item)
+    assert time.perf_counter() - start < TARGET_SECONDS
+
+    # The first search after an update must not pay for a rebuild.
+    assert search_time(index, "fresh") < TARGET_SECONDS
+    assert search_time(index, "renamed/ma") < TARGET_SECONDS
+    assert search_time(index, "renamed_file") < TARGET_SECONDS
+    assert search_time(index, "ma zq") < TARGET_SECONDS